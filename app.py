@@ -4,18 +4,54 @@ Provides a web UI for uploading and validating zip files containing XML.
 """
 import os
 import tempfile
-from flask import Flask, render_template, request, jsonify
+from urllib.parse import unquote
+from flask import Flask, Request, Response, render_template, request, jsonify
 from werkzeug.exceptions import RequestEntityTooLarge
 from xmlvalidator import XMLValidator
 
+try:
+    import orjson  # Optional: serializes large xml_content strings in C
+except ImportError:
+    orjson = None
+
+
+class UploadRequest(Request):
+    """
+    Request that has werkzeug's multipart parser write file parts straight into
+    a unique temp file, instead of a SpooledTemporaryFile that file.save() then copies.
+    """
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.upload_paths = []  # Temp files created by the form parser for this request
+    
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        """Return a named temp file on disk as the target for an uploaded file part."""
+        stream = tempfile.NamedTemporaryFile('wb+', suffix='.zip', prefix='xmlvalidator_upload_', delete=False)
+        self.upload_paths.append(stream.name)
+        return stream
+    
+    def close(self):
+        """Close file parts and remove their temp files once the request is done."""
+        super().close()
+        for path in self.upload_paths:
+            if os.path.exists(path):
+                try:
+                    os.remove(path)
+                except Exception as cleanup_error:
+                    print(f"Warning: Could not cleanup temp file {path}: {cleanup_error}")
+
+
 app = Flask(__name__)
+app.request_class = UploadRequest
 MAX_FILE_SIZE = 50 * 1024 * 1024  # 50MB max file size
 app.config['MAX_CONTENT_LENGTH'] = MAX_FILE_SIZE
 app.config['SECRET_KEY'] = os.urandom(24)
-# Note: Uploaded files use tempfile.mkstemp() for unique, secure temporary files
-# Extracted files use tempfile.mkdtemp() - both are automatically cleaned up
+# Note: Uploaded files are written once, directly to unique mkstemp()-backed temporary files
+# XML members are read in place from the archive, so nothing else touches disk
 
 ALLOWED_EXTENSIONS = {'zip'}
+UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024  # 4 MiB reads when streaming raw upload bodies
 
 
 def allowed_file(filename):
@@ -23,6 +59,55 @@ def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 
+def stream_to_file(stream, fd, limit=MAX_FILE_SIZE, size_hint=None):
+    """
+    Copy a raw request body into an open file descriptor in fixed-size chunks.
+    
+    Args:
+        stream: Readable binary stream (e.g. request.stream)
+        fd: File descriptor returned by tempfile.mkstemp()
+        limit: Maximum number of bytes accepted before aborting
+        size_hint: Expected body size (Content-Length), used to preallocate the file
+    
+    Returns:
+        Number of bytes written
+    
+    Raises:
+        RequestEntityTooLarge: If the body grows past the limit
+    """
+    preallocated = 0
+    if size_hint and size_hint <= limit and hasattr(os, 'posix_fallocate'):
+        # Reserve the blocks up front so the filesystem can lay the file out contiguously
+        try:
+            os.posix_fallocate(fd, 0, size_hint)
+            preallocated = size_hint
+        except OSError:
+            pass
+    
+    bytes_written = 0
+    with os.fdopen(fd, 'wb', buffering=0) as out:
+        while chunk := stream.read(UPLOAD_CHUNK_SIZE):
+            bytes_written += len(chunk)
+            if bytes_written > limit:
+                raise RequestEntityTooLarge()
+            out.write(chunk)
+        
+        # A short body must not leave preallocated zero bytes after the zip's end record
+        if bytes_written < preallocated:
+            out.truncate(bytes_written)
+    return bytes_written
+
+
+def json_response(payload):
+    """
+    Serialize a response dict to JSON, using orjson when it is installed
+    and falling back to Flask's jsonify otherwise.
+    """
+    if orjson is not None:
+        return Response(orjson.dumps(payload), mimetype='application/json')
+    return jsonify(payload)
+
+
 @app.route('/')
 def index():
     """Render the main page."""
@@ -31,26 +116,39 @@ def index():
 
 @app.route('/upload', methods=['POST'])
 def upload_file():
-    """Handle file upload and validation."""
-    if 'file' not in request.files:
-        return jsonify({'success': False, 'error': 'No file provided'}), 400
+    """
+    Handle file upload and validation.
     
-    file = request.files['file']
-    target_xml = request.form.get('target_xml', '').strip() or None
+    Accepts either a raw ZIP body (Content-Type: application/octet-stream, filename
+    in the X-Filename header, target_xml in the query string) which is streamed
+    straight to disk, or a classic multipart form with 'file' and 'target_xml' fields.
+    """
+    # Raw uploads bypass werkzeug's form parser so the body is written to disk only once
+    raw_upload = request.mimetype == 'application/octet-stream'
     
-    if file.filename == '':
+    if raw_upload:
+        file = None
+        filename = unquote(request.headers.get('X-Filename', ''))
+        target_xml = request.args.get('target_xml', '').strip() or None
+    else:
+        if 'file' not in request.files:
+            return jsonify({'success': False, 'error': 'No file provided'}), 400
+        
+        file = request.files['file']
+        filename = file.filename
+        target_xml = request.form.get('target_xml', '').strip() or None
+    
+    if filename == '':
         return jsonify({'success': False, 'error': 'No file selected'}), 400
     
-    if not allowed_file(file.filename):
+    if not allowed_file(filename):
         return jsonify({'success': False, 'error': 'Invalid file type. Only ZIP files are allowed.'}), 400
     
     # Check Content-Length header if available (Flask's MAX_CONTENT_LENGTH will also enforce this)
+    # Same 413 response the multipart path gets from the form parser
     content_length = request.content_length
     if content_length and content_length > MAX_FILE_SIZE:
-        return jsonify({
-            'success': False, 
-            'error': f'File size ({content_length / 1024 / 1024:.2f} MB) exceeds maximum allowed size of 50 MB.'
-        }), 400
+        return handle_file_too_large(None)
     
     # Create a unique temporary file for the uploaded ZIP
     # This ensures no filename conflicts and better security
@@ -58,19 +156,22 @@ def upload_file():
     filepath = None
     
     try:
-        # Create unique temporary file with .zip extension
-        file_handle, filepath = tempfile.mkstemp(suffix='.zip', prefix='xmlvalidator_upload_')
-        os.close(file_handle)  # Close the file handle, we'll use file.save() instead
-        
-        # Save uploaded file to the unique temp file
-        file.save(filepath)
+        if raw_upload:
+            # Create unique temporary file with .zip extension
+            file_handle, filepath = tempfile.mkstemp(suffix='.zip', prefix='xmlvalidator_upload_')
+            
+            # Stream the request body straight into the temp file (fd is closed by the helper)
+            if stream_to_file(request.stream, file_handle, size_hint=content_length) == 0:
+                return jsonify({'success': False, 'error': 'No file provided'}), 400
+        else:
+            # The form parser already wrote the part into a unique temp file (see UploadRequest)
+            file.stream.close()
+            filepath = file.stream.name
         
         # Process the zip file
-        validator = XMLValidator(filepath)
-        result = validator.process_zip(target_xml)
-        
-        # Clean up extracted files (uses temp directory automatically)
-        validator.cleanup()
+        # The context manager releases the archive and cleans up any extracted files
+        with XMLValidator(filepath) as validator:
+            result = validator.process_zip_fast(target_xml)
         
         # Format result for JSON response
         # Create a mapping of XML filenames to their timestamps
@@ -99,7 +200,7 @@ def upload_file():
         }
         
         try:
-            return jsonify(response)
+            return json_response(response)
         except Exception as json_error:
             # If JSON serialization fails (e.g., due to encoding issues), return error
             print(f"Error serializing response to JSON: {str(json_error)}")
@@ -108,6 +209,9 @@ def upload_file():
                 'error': 'Error formatting response. The file may contain invalid characters.'
             }), 500
         
+    except RequestEntityTooLarge:
+        return handle_file_too_large(None)
+        
     except Exception as e:
         # Ensure we always return valid JSON, even for unexpected errors
         try:
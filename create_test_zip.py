@@ -4,72 +4,97 @@ Script to create a test ZIP file of approximately 50MB with XML files inside.
 import zipfile
 import os
 import tempfile
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import XMLGenerator
 import random
 import string
 
+# Random text is sliced out of precomputed pools instead of calling random.choices per field.
+# The pools are large enough that the slices stay effectively random text.
+POOL_SIZE = 1024 * 1024
+ALNUM_POOL = ''.join(random.choices(string.ascii_letters + string.digits, k=POOL_SIZE))
+PRINTABLE_POOL = ''.join(random.choices(string.ascii_letters + string.digits + string.punctuation, k=POOL_SIZE))
+
+STATUSES = ("active", "inactive", "pending", "completed", "failed")
+
+
+def random_text(k, pool=ALNUM_POOL):
+    """Return k random characters sliced from a precomputed pool at a random offset."""
+    offset = random.randrange(len(pool) - k)
+    return pool[offset:offset + k]
+
+
+def _write_text_element(xml, name, text, attrs=None):
+    """Write a complete <name>text</name> element through an XMLGenerator."""
+    xml.startElement(name, attrs or {})
+    xml.characters(text)
+    xml.endElement(name)
+
+
 def create_large_xml_file(filepath, target_size_mb=10):
     """
     Create an XML file of approximately target_size_mb MB.
     
+    Entries are streamed to disk as they are generated, so memory use stays flat
+    and nothing is re-serialized as the file grows.
+    
     Args:
         filepath: Path where to save the XML file
         target_size_mb: Target size in MB
     """
     target_size_bytes = target_size_mb * 1024 * 1024
     
-    # Create XML structure
-    root = ET.Element("test_data")
-    root.set("version", "1.0")
-    
-    # Add metadata
-    metadata = ET.SubElement(root, "metadata")
-    ET.SubElement(metadata, "created_by").text = "XML Validator Test Generator"
-    ET.SubElement(metadata, "purpose").text = "Testing 50MB file size limit"
-    
-    # Create data section with repetitive content to reach target size
-    data_section = ET.SubElement(root, "data")
-    
-    # Each entry is about 500 bytes, so we need approximately target_size_bytes / 500 entries
-    bytes_written = 0
     entry_count = 0
     
-    # Write in chunks to avoid memory issues
-    chunk_size = 1000  # Number of entries per chunk
+    # Check the file size after every chunk of entries (~150KB) so files land close to target
+    chunk_size = 100  # Number of entries per chunk
     
-    while bytes_written < target_size_bytes:
-        for i in range(chunk_size):
-            entry = ET.SubElement(data_section, "entry")
-            entry.set("id", f"entry_{entry_count:08d}")
-            
-            # Use more varied content to reduce compression ratio
-            import random
-            import string
-            
-            ET.SubElement(entry, "name").text = f"Test Entry {entry_count} - {''.join(random.choices(string.ascii_letters + string.digits, k=50))}"
-            ET.SubElement(entry, "description").text = f"This is test entry {entry_count} with unique identifier {entry_count * 12345} used for testing the 50MB file size limit. Random data: {''.join(random.choices(string.ascii_letters + string.digits, k=100))}"
-            ET.SubElement(entry, "value").text = f"Value_{entry_count}_{entry_count * 7}_{entry_count * 13}_" + ''.join(random.choices(string.ascii_letters + string.digits + string.punctuation, k=300))
-            ET.SubElement(entry, "timestamp").text = f"2024-{(entry_count % 12) + 1:02d}-{(entry_count % 28) + 1:02d}T{(entry_count % 24):02d}:{(entry_count % 60):02d}:{(entry_count % 60):02d}+00:00"
-            ET.SubElement(entry, "category").text = f"category_{entry_count % 10}"
-            ET.SubElement(entry, "status").text = random.choice(["active", "inactive", "pending", "completed", "failed"])
-            
-            # Add nested elements with varied content
-            details = ET.SubElement(entry, "details")
-            ET.SubElement(details, "field1").text = ''.join(random.choices(string.ascii_letters + string.digits, k=100))
-            ET.SubElement(details, "field2").text = ''.join(random.choices(string.ascii_letters + string.digits, k=100))
-            ET.SubElement(details, "field3").text = ''.join(random.choices(string.ascii_letters + string.digits, k=100))
-            ET.SubElement(details, "field4").text = ''.join(random.choices(string.ascii_letters + string.digits, k=100))
-            ET.SubElement(details, "random_data").text = ''.join(random.choices(string.ascii_letters + string.digits + string.punctuation, k=200))
-            
-            entry_count += 1
+    with open(filepath, 'wb') as out:
+        xml = XMLGenerator(out, encoding='utf-8')
+        xml.startDocument()
+        
+        # Create XML structure
+        xml.startElement("test_data", {"version": "1.0"})
+        
+        # Add metadata
+        xml.startElement("metadata", {})
+        _write_text_element(xml, "created_by", "XML Validator Test Generator")
+        _write_text_element(xml, "purpose", "Testing 50MB file size limit")
+        xml.endElement("metadata")
+        
+        # Create data section with repetitive content to reach target size
+        xml.startElement("data", {})
+        
+        # Bind the per-entry helper as a local to skip a global lookup in the hot loop
+        choice = random.choice
         
-        # Write to file periodically to check size
-        tree = ET.ElementTree(root)
-        tree.write(filepath, encoding='utf-8', xml_declaration=True)
-        bytes_written = os.path.getsize(filepath)
+        while out.tell() < target_size_bytes:
+            for i in range(chunk_size):
+                xml.startElement("entry", {"id": f"entry_{entry_count:08d}"})
+                
+                # Use more varied content to reduce compression ratio
+                _write_text_element(xml, "name", f"Test Entry {entry_count} - {random_text(50)}")
+                _write_text_element(xml, "description", f"This is test entry {entry_count} with unique identifier {entry_count * 12345} used for testing the 50MB file size limit. Random data: {random_text(100)}")
+                _write_text_element(xml, "value", f"Value_{entry_count}_{entry_count * 7}_{entry_count * 13}_" + random_text(300, PRINTABLE_POOL))
+                _write_text_element(xml, "timestamp", f"2024-{(entry_count % 12) + 1:02d}-{(entry_count % 28) + 1:02d}T{(entry_count % 24):02d}:{(entry_count % 60):02d}:{(entry_count % 60):02d}+00:00")
+                _write_text_element(xml, "category", f"category_{entry_count % 10}")
+                _write_text_element(xml, "status", choice(STATUSES))
+                
+                # Add nested elements with varied content
+                xml.startElement("details", {})
+                _write_text_element(xml, "field1", random_text(100))
+                _write_text_element(xml, "field2", random_text(100))
+                _write_text_element(xml, "field3", random_text(100))
+                _write_text_element(xml, "field4", random_text(100))
+                _write_text_element(xml, "random_data", random_text(200, PRINTABLE_POOL))
+                xml.endElement("details")
+                
+                xml.endElement("entry")
+                entry_count += 1
         
-        if bytes_written >= target_size_bytes:
-            break
+        xml.endElement("data")
+        xml.endElement("test_data")
+        xml.endDocument()
+        bytes_written = out.tell()
     
     print(f"Created XML file: {filepath} ({bytes_written / 1024 / 1024:.2f} MB, {entry_count} entries)")
 
@@ -98,14 +123,13 @@ def create_test_zip(output_path="test_50mb.zip", target_size_mb=50):
         target_size_bytes = target_size_mb * 1024 * 1024
         
         # Create multiple XML files to reach target size
-        # With less repetitive content, compression will be less effective (~60-70% compression)
-        # Target: ~50MB compressed, so we need ~70-80MB uncompressed
+        # Entries are stored uncompressed, so the ZIP is about as large as the XML files
         # Check if we want a file just under the limit
         import sys
         if len(sys.argv) > 1 and sys.argv[1] == '--under-limit':
-            file_sizes = [22, 22, 18, 13]  # MB per file (uncompressed) - just under limit
+            file_sizes = [14, 14, 11, 9]  # MB per file - just under limit
         else:
-            file_sizes = [25, 25, 20, 15]  # MB per file (uncompressed) - over limit
+            file_sizes = [15, 15, 12, 10]  # MB per file - over limit
         
         for i, size_mb in enumerate(file_sizes):
             xml_path = os.path.join(temp_dir, f"test_data_{i+1}.xml")
@@ -117,7 +141,8 @@ def create_test_zip(output_path="test_50mb.zip", target_size_mb=50):
         print(f"Creating ZIP file...")
         
         # Create ZIP file
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        # ZIP_STORED: the random content barely compresses, so DEFLATE would only burn CPU
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_STORED) as zipf:
             for xml_file in xml_files:
                 zipf.write(xml_file, os.path.basename(xml_file))
                 print(f"  Added: {os.path.basename(xml_file)}")
@@ -153,8 +178,6 @@ if __name__ == '__main__':
     # Check if user wants a file just under 50MB (for testing acceptance)
     if len(sys.argv) > 1 and sys.argv[1] == '--under-limit':
         output_file = "test_49mb.zip"
-        # Create a file just under 50MB
-        file_sizes = [24, 24, 19, 14]  # Slightly smaller
         print("Creating test ZIP file just under 50MB limit...")
     else:
         output_file = "test_50mb.zip"
@@ -0,0 +1,67 @@
+"""
+Gunicorn configuration for XML Validator
+Loaded automatically when gunicorn is started from the project directory: gunicorn app:app
+"""
+import multiprocessing
+import os
+
+
+def _memory_limit_bytes():
+    """
+    Memory available to this container or machine, in bytes.
+    
+    Returns:
+        The cgroup memory limit if one is set, otherwise MemTotal from /proc/meminfo,
+        or None if neither can be read (e.g. on macOS or Windows)
+    """
+    # cgroup v2, then v1 (v1 reports a huge number when unlimited)
+    for path in ('/sys/fs/cgroup/memory.max', '/sys/fs/cgroup/memory/memory.limit_in_bytes'):
+        try:
+            with open(path) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < 1 << 60:
+            return int(value)
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemTotal:'):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError, IndexError):
+        pass
+    return None
+
+
+# Bind to the port provided by the platform (Render/Railway set PORT)
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+
+# gthread workers overlap the I/O-bound upload + unzip work better than sync workers
+worker_class = 'gthread'
+threads = int(os.environ.get('GUNICORN_THREADS', 4))
+
+# Every in-flight request may hold a 50MB upload plus the decoded XML in memory, so the
+# number of concurrent requests (workers * threads) is bounded by the memory limit divided
+# by GUNICORN_REQUEST_MEMORY_MB. Within that, use 2 * cores + 1 workers, capped by
+# GUNICORN_MAX_WORKERS. On a 512MB instance this gives 1 worker with 4 threads.
+request_memory = int(os.environ.get('GUNICORN_REQUEST_MEMORY_MB', 128)) * 1024 * 1024
+memory_limit = _memory_limit_bytes()
+max_concurrency = max(1, memory_limit // request_memory) if memory_limit else None
+
+if max_concurrency is not None:
+    threads = max(1, min(threads, max_concurrency))
+workers = min(
+    multiprocessing.cpu_count() * 2 + 1,
+    int(os.environ.get('GUNICORN_MAX_WORKERS', 8)),
+)
+if max_concurrency is not None:
+    workers = max(1, min(workers, max_concurrency // threads))
+
+# Large uploads over slow links need longer than the 30s default
+timeout = 120
+graceful_timeout = 30
+keepalive = 5
+
+# Recycle workers periodically to bound RSS growth
+max_requests = 500
+max_requests_jitter = 50
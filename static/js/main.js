@@ -93,7 +93,7 @@ document.addEventListener('DOMContentLoaded', function() {
             return;
         }
 
-        const formData = new FormData(uploadForm);
+        const file = fileInput.files[0];
         const targetXml = document.getElementById('targetXml').value.trim();
 
         // Show loading state
@@ -103,9 +103,15 @@ document.addEventListener('DOMContentLoaded', function() {
         resultsSection.style.display = 'none';
 
         try {
-            const response = await fetch('/upload', {
+            // Send the ZIP as the raw request body so the server can stream it to disk
+            const query = targetXml ? `?target_xml=${encodeURIComponent(targetXml)}` : '';
+            const response = await fetch('/upload' + query, {
                 method: 'POST',
-                body: formData
+                headers: {
+                    'Content-Type': 'application/octet-stream',
+                    'X-Filename': encodeURIComponent(file.name)
+                },
+                body: file
             });
 
             // Check if response has content
@@ -2,17 +2,222 @@
 XML Validator Module
 Handles extraction and validation of XML files from zip archives.
 """
+import asyncio
+import calendar
+import functools
+import mmap
 import zipfile
 import os
 import tempfile
 import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 
+try:
+    import libarchive  # Optional: decompresses in C with the GIL released
+    _HAS_LIBARCHIVE = True
+except ImportError:
+    _HAS_LIBARCHIVE = False
+
+# Leading signatures of a zip file: local file header, empty archive, spanned archive
+ZIP_MAGIC_NUMBERS = (b'PK\x03\x04', b'PK\x05\x06', b'PK\x07\x08')
+
+# Archives with at least this many files are extracted by a thread pool
+PARALLEL_EXTRACT_THRESHOLD = 64
+
+# Upper bound for the per-member copy buffer used during extraction
+EXTRACT_BUFFER_SIZE = 1024 * 1024
+
+# Most recently read XML files kept in memory per validator, to cap memory on large archives
+CONTENT_CACHE_SIZE = 32
+
+
+def _format_zip_date(date_time: Tuple[int, int, int, int, int, int]) -> str:
+    """
+    Format a ZipInfo.date_time tuple as 'YYYY-MM-DD HH:MM:SS'.
+    Formats the fields directly instead of building a datetime and calling strftime.
+    
+    Args:
+        date_time: Tuple of (year, month, day, hour, minute, second)
+    
+    Returns:
+        Formatted timestamp string
+    
+    Raises:
+        ValueError: If a field is out of range (zip headers can carry e.g. month 0)
+    """
+    year, month, day, hour, minute, second = date_time
+    # Same bounds datetime() enforces, including the month length (e.g. no February 30th)
+    if not (1 <= year and 1 <= month <= 12 and hour < 24 and minute < 60 and second < 60
+            and 1 <= day <= calendar.monthrange(year, month)[1]):
+        raise ValueError(f"Invalid zip date: {date_time}")
+    return f'{year:04d}-{month:02d}-{day:02d} {hour:02d}:{minute:02d}:{second:02d}'
+
+
+def _open_zip_file(path: str) -> Tuple[zipfile.ZipFile, BinaryIO]:
+    """
+    Open an archive and parse its central directory.
+    
+    Args:
+        path: Path to the zip file
+    
+    Returns:
+        Tuple of (zip_file, file); ZipFile does not close a file object it was given,
+        so the caller must close both
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+        OSError: If the file cannot be opened
+        zipfile.BadZipFile: If the file is not a valid zip archive
+    """
+    # One open serves both the signature check and the ZipFile itself
+    file = open(path, 'rb')
+    try:
+        # Cheap first check on the leading signature before ZipFile scans for the end record
+        if file.read(4) not in ZIP_MAGIC_NUMBERS:
+            raise zipfile.BadZipFile(f"'{path}' does not start with a zip signature.")
+        file.seek(0)
+        return zipfile.ZipFile(file, 'r'), file
+    except BaseException:
+        file.close()
+        raise
+
+
+def _write_members(zip_ref: zipfile.ZipFile, members: List[Tuple[zipfile.ZipInfo, str]]):
+    """
+    Write file members to their target paths. Parent directories must already exist.
+    Empty files are created directly, without setting up a decompression stream.
+    
+    Args:
+        zip_ref: Open ZipFile to read from
+        members: (ZipInfo, target_path) pairs for regular file members
+    """
+    for info, target_path in members:
+        if info.file_size == 0:
+            open(target_path, 'wb').close()
+            continue
+        # Size the copy buffer to the member so small files take one read/write
+        # and large ones move in 1 MiB chunks (floored at 8 KiB: buffering=1 means line buffering)
+        buffer_size = min(max(info.file_size, 8192), EXTRACT_BUFFER_SIZE)
+        with zip_ref.open(info) as source, open(target_path, 'wb', buffering=buffer_size) as target:
+            shutil.copyfileobj(source, target, buffer_size)
+
+
+def _extract_members(zip_path: str, members: List[Tuple[zipfile.ZipInfo, str]]):
+    """
+    Extract a batch of members. Runs in a worker thread, so it opens its own
+    ZipFile handle; zlib releases the GIL while inflating.
+    
+    Args:
+        zip_path: Path to the zip file
+        members: (ZipInfo, target_path) pairs for regular file members
+    """
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        _write_members(zip_ref, members)
+
+
+def _read_file_mmap(path: str, encoding: Optional[str] = 'utf-8') -> Union[str, bytes]:
+    """
+    Read a whole file through a read-only memory map, decoding it in one pass
+    instead of through the text IO layer's chunked decoding.
+    
+    Args:
+        path: Path to the file
+        encoding: Text encoding of the file, or None to return the raw bytes
+    
+    Returns:
+        Decoded file contents, or bytes if encoding is None
+    """
+    with open(path, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return b'' if encoding is None else ''  # Empty files cannot be mapped
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if hasattr(mm, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return mm[:] if encoding is None else str(mm, encoding)
+
+
+async def _run_in_thread(func, *args):
+    """
+    Run a blocking call in the event loop's default thread pool.
+    
+    Args:
+        func: Blocking function to call
+        *args: Positional arguments for func
+    
+    Returns:
+        Whatever func returns
+    """
+    # run_in_executor rather than asyncio.to_thread, which needs Python 3.9
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(func, *args))
+
+
+def _path_suffixes(name: str) -> List[str]:
+    """
+    List the trailing path suffixes of a member name, shortest first.
+    For 'a/b/c.xml' this is ['c.xml', 'b/c.xml'] (the full name is not included).
+    
+    Args:
+        name: Member name using '/' separators
+    
+    Returns:
+        List of proper suffixes of the name
+    """
+    parts = name.split('/')
+    return ['/'.join(parts[i:]) for i in range(len(parts) - 1, 0, -1)]
+
+
+def _iter_files(root: str):
+    """
+    Recursively yield os.DirEntry objects for files under a directory.
+    Files in a directory are yielded before its subdirectories, like os.walk,
+    but file types come from the directory listing instead of a stat per entry.
+    
+    Args:
+        root: Directory to scan
+    
+    Yields:
+        DirEntry for each file found
+    """
+    subdirs = []
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+            elif entry.is_file():
+                yield entry
+    for subdir in subdirs:
+        yield from _iter_files(subdir)
+
+
+def _scan_xml_entries(root: str):
+    """
+    Recursively yield os.DirEntry objects for XML files under a directory.
+    
+    Args:
+        root: Directory to scan
+    
+    Yields:
+        DirEntry for each XML file found
+    """
+    for entry in _iter_files(root):
+        if entry.name[-4:].lower() == '.xml':
+            yield entry
+
 
 class XMLValidator:
-    """Class to handle XML file extraction and validation from zip files."""
+    """
+    Class to handle XML file extraction and validation from zip files.
+    
+    Reads (read_xml_file, the async variants, get_xml_content, ...) may run concurrently
+    on one validator. open_zip, extract_zip and cleanup must not overlap with other calls.
+    """
     
     def __init__(self, zip_path: str, extract_to: Optional[str] = None):
         """
@@ -26,21 +231,84 @@ class XMLValidator:
         self.extract_to = extract_to
         self.extracted_files = []
         self.extract_folder = None
+        self._zf = None  # Open ZipFile handle for in-place member access
+        self._zf_file = None  # File object behind _zf (ZipFile does not close it)
+        self._xml_files = None  # Memoized result of find_xml_files()
+        self._name_index = None  # Member name and basename -> member name (archive mode)
+        self._path_index = {}  # Member name, basename and disk path -> extracted path
+        self._content_cache = OrderedDict()  # (name, binary) -> successful read_xml_file result
+        self._lock = threading.Lock()  # Guards the lazy handle, the name index and the content cache
+    
+    def __enter__(self) -> 'XMLValidator':
+        """Use the validator as a context manager; the archive opens lazily on first use."""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Release the archive and remove any temp extraction on exit."""
+        self.cleanup()
+        
+    def _open_zip(self) -> Tuple[Optional[zipfile.ZipFile], str]:
+        """
+        Open the archive once per validator, validating it in the same step.
         
+        Returns:
+            Tuple of (zip_file, error_message); zip_file is None on failure
+        """
+        try:
+            return self._load_zip(), ""
+        except FileNotFoundError:
+            return None, f"Zip file '{self.zip_path}' not found."
+        except zipfile.BadZipFile:
+            return None, f"'{self.zip_path}' is not a valid zip file."
+        except OSError as e:
+            return None, f"Could not read '{self.zip_path}': {str(e)}"
+    
+    def _load_zip(self) -> zipfile.ZipFile:
+        """
+        Return the open ZipFile for this validator, opening it on first use.
+        
+        Returns:
+            Open ZipFile handle
+        
+        Raises:
+            FileNotFoundError: If the file does not exist
+            OSError: If the zip file cannot be read
+            zipfile.BadZipFile: If the zip file is invalid
+        """
+        with self._lock:
+            if self._zf is None:
+                self._zf, self._zf_file = _open_zip_file(self.zip_path)
+            return self._zf
+    
     def validate_zip(self) -> Tuple[bool, str]:
         """
         Validate that the zip file exists and is readable.
+        The archive is opened (and kept open) as part of the check.
         
         Returns:
             Tuple of (is_valid, error_message)
         """
-        if not os.path.exists(self.zip_path):
-            return False, f"Zip file '{self.zip_path}' not found."
+        zf, error = self._open_zip()
+        return zf is not None, error
+    
+    def open_zip(self) -> Tuple[bool, str, List[str]]:
+        """
+        Open the zip file for in-place member access and list all files.
+        Nothing is written to disk; members are read straight from the archive.
+        
+        Returns:
+            Tuple of (success, message, list_of_files)
+        """
+        zf, error = self._open_zip()
+        if zf is None:
+            return False, error, []
         
-        if not zipfile.is_zipfile(self.zip_path):
-            return False, f"'{self.zip_path}' is not a valid zip file."
+        self.extracted_files = zf.namelist()
+        self._xml_files = None
+        self._name_index = None
+        self._content_cache.clear()
         
-        return True, ""
+        return True, f"Found {len(self.extracted_files)} files in archive.", self.extracted_files
     
     def extract_zip(self) -> Tuple[bool, str, List[str]]:
         """
@@ -49,8 +317,8 @@ class XMLValidator:
         Returns:
             Tuple of (success, message, list_of_files)
         """
-        is_valid, error = self.validate_zip()
-        if not is_valid:
+        zip_ref, error = self._open_zip()
+        if zip_ref is None:
             return False, error, []
         
         try:
@@ -62,10 +330,30 @@ class XMLValidator:
                 # Use temp directory
                 self.extract_folder = tempfile.mkdtemp(prefix='xmlvalidator_')
             
-            # Extract zip file
-            with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-                zip_ref.extractall(self.extract_folder)
-                self.extracted_files = zip_ref.namelist()
+            # One pass over the member list feeds extraction, the file list and the index
+            infos = zip_ref.infolist()
+            files = [(info, self._extracted_path(info.filename)) for info in infos if not info.is_dir()]
+            
+            # Extract zip file, through libarchive when available (stdlib for encrypted archives,
+            # and whenever libarchive cannot write exactly the members zipfile lists)
+            self._create_dirs(infos, files)
+            use_libarchive = _HAS_LIBARCHIVE and not any(info.flag_bits & 0x1 for info, _ in files)
+            if not (use_libarchive and self._extract_with_libarchive(files)):
+                self._extract_all(zip_ref, files)
+            self.extracted_files = [info.filename for info in infos]
+            self._xml_files = None
+            self._content_cache.clear()
+            
+            # Index extracted files by member name, disk path and every trailing path suffix
+            # (first member wins), so partial paths like 'b/c.xml' resolve with one lookup
+            path_index = {}
+            for info, path in files:
+                for suffix in _path_suffixes(info.filename):
+                    path_index.setdefault(suffix, path)
+            for info, path in files:
+                path_index[info.filename] = path
+                path_index[path] = path
+            self._path_index = path_index
             
             return True, f"Files extracted to: '{self.extract_folder}'", self.extracted_files
             
@@ -74,104 +362,294 @@ class XMLValidator:
         except Exception as e:
             return False, f"Error extracting zip file: {str(e)}", []
     
+    async def extract_zip_async(self) -> Tuple[bool, str, List[str]]:
+        """
+        Async variant of extract_zip that runs the extraction in a worker thread,
+        leaving the event loop free to serve other requests.
+        
+        Returns:
+            Tuple of (success, message, list_of_files)
+        """
+        return await _run_in_thread(self.extract_zip)
+    
+    def _create_dirs(self, infos: List[zipfile.ZipInfo], files: List[Tuple[zipfile.ZipInfo, str]]):
+        """
+        Create every directory of the archive once, before any member is written
+        (directory entries are not written as files), so members are written without
+        per-file makedirs and worker threads never race on it.
+        
+        Args:
+            infos: Every member of the archive, from zip_ref.infolist()
+            files: (info, target_path) pairs for the file members of infos
+        """
+        dirs = {self._extracted_path(info.filename) for info in infos if info.is_dir()}
+        dirs.update(os.path.dirname(target_path) for _, target_path in files)
+        # Shallowest first, so each parent already exists and makedirs does a single mkdir
+        for directory in sorted(dirs, key=lambda path: path.count(os.path.sep)):
+            os.makedirs(directory, exist_ok=True)
+    
+    def _extract_all(self, zip_ref: zipfile.ZipFile, files: List[Tuple[zipfile.ZipInfo, str]]):
+        """
+        Write every file member of the archive into the extract folder, spreading
+        large archives across a thread pool. Directories must already exist.
+        
+        Args:
+            zip_ref: Open ZipFile for this validator's archive
+            files: (info, target_path) pairs for the file members of the archive
+        """
+        if len(files) < PARALLEL_EXTRACT_THRESHOLD:
+            _write_members(zip_ref, files)
+            return
+        
+        workers = os.cpu_count() or 1
+        batches = [files[i::workers] for i in range(workers)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # list() re-raises any exception from a worker
+            list(executor.map(_extract_members, repeat(self.zip_path), batches))
+    
+    def _extract_with_libarchive(self, files: List[Tuple[zipfile.ZipInfo, str]]) -> bool:
+        """
+        Write every file member of the archive into the extract folder using libarchive,
+        which releases the GIL while decompressing so concurrent requests can proceed.
+        Directories must already exist.
+        
+        Members are only written to the targets computed from zipfile's names, so the
+        file list and index built from those names always match what is on disk.
+        
+        Args:
+            files: (info, target_path) pairs for the file members of the archive
+        
+        Returns:
+            True if every member was written; False if the caller should extract with zipfile
+            (libarchive failed, or an entry's name or type differs from what zipfile reports)
+        """
+        targets = {info.filename: target_path for info, target_path in files}
+        written = 0
+        try:
+            with libarchive.file_reader(self.zip_path) as archive:
+                for entry in archive:
+                    if entry.isdir:
+                        continue
+                    # Names differ e.g. when zipfile decodes a non-UTF-8 name as cp437
+                    target_path = targets.get(entry.pathname)
+                    if target_path is None or not entry.isreg:
+                        return False
+                    with open(target_path, 'wb') as target:
+                        for block in entry.get_blocks():
+                            target.write(block)
+                    written += 1
+        except libarchive.ArchiveError as e:
+            print(f"Warning: libarchive extraction failed, falling back to zipfile: {str(e)}")
+            return False
+        return written == len(files)
+    
     def find_xml_files(self) -> List[str]:
         """
-        Find all XML files in the extracted directory.
+        Find all XML files in the open archive, or in the extracted directory.
         
         Returns:
-            List of XML file paths
+            List of XML member names (archive mode) or file paths (extracted mode)
         """
-        if not self.extract_folder or not os.path.exists(self.extract_folder):
+        if self._xml_files is not None:
+            return self._xml_files
+        
+        if self.extract_folder is None:
+            # Archive mode: filter the central directory
+            zf, _ = self._open_zip()
+            if zf is None:
+                return []
+            self._xml_files = [
+                info.filename for info in zf.infolist()
+                if info.filename[-4:].lower() == '.xml'  # Directory names end in '/', so never match
+            ]
+            return self._xml_files
+        
+        if not os.path.exists(self.extract_folder):
             return []
         
-        xml_files = []
-        for root, dirs, files in os.walk(self.extract_folder):
-            for file in files:
-                if file.lower().endswith('.xml'):
-                    xml_files.append(os.path.join(root, file))
+        if self.extracted_files:
+            # The namelist from extract_zip already enumerates every member, so no walk is needed
+            self._xml_files = [
+                self._extracted_path(name) for name in self.extracted_files
+                if name[-4:].lower() == '.xml'
+            ]
+            return self._xml_files
         
-        return xml_files
+        # No namelist to work from (the archive listed no members): scan the file system
+        self._xml_files = [entry.path for entry in _scan_xml_entries(self.extract_folder)]
+        return self._xml_files
     
-    def get_xml_file_timestamps(self) -> Dict[str, str]:
+    def _extracted_path(self, name: str) -> str:
+        """
+        Map an archive member name to the path ZipFile.extract() writes it to.
+        
+        Args:
+            name: Archive member name
+        
+        Returns:
+            Path of the member inside the extract folder
+        """
+        # Same sanitizing as zipfile: drop the drive, empty, '.' and '..' components
+        arcname = os.path.splitdrive(name.replace('/', os.path.sep))[1]
+        parts = [part for part in arcname.split(os.path.sep) if part not in ('', os.path.curdir, os.path.pardir)]
+        return os.path.join(self.extract_folder, *parts)
+    
+    def get_xml_file_timestamps(self, xml_files: Optional[List[str]] = None) -> Dict[str, str]:
         """
         Get timestamps for XML files from the zip archive.
         
+        Args:
+            xml_files: Optional list from find_xml_files(). If None, it is computed here.
+        
         Returns:
             Dictionary mapping XML file paths to their timestamps (formatted as strings)
         """
         timestamps = {}
         
-        if not os.path.exists(self.zip_path):
+        zip_ref, _ = self._open_zip()
+        if zip_ref is None:
+            return timestamps
+        
+        if xml_files is None:
+            xml_files = self.find_xml_files()
+        
+        if self.extract_folder is None:
+            # Archive mode: XML files are member names, so read dates straight from the central directory
+            for name in xml_files:
+                try:
+                    timestamps[name] = _format_zip_date(zip_ref.getinfo(name).date_time)
+                except (KeyError, ValueError, TypeError):
+                    timestamps[name] = 'Unknown'
             return timestamps
         
         try:
-            with zipfile.ZipFile(self.zip_path, 'r') as zip_ref:
-                # Get all XML files found in the extracted directory
-                xml_files = self.find_xml_files()
+            # Index zip entries once by normalized path and by basename (first entry wins)
+            # Handle both forward and backward slashes
+            by_norm = {}
+            by_base = {}
+            for zip_info in zip_ref.infolist():
+                normalized_entry = zip_info.filename.replace('\\', '/')
+                by_norm.setdefault(normalized_entry, zip_info)
+                by_base.setdefault(os.path.basename(normalized_entry), zip_info)
+            
+            # Match each extracted XML file to its zip entry
+            for xml_path in xml_files:
+                # Get relative path from extract folder
+                normalized_rel = os.path.relpath(xml_path, self.extract_folder).replace('\\', '/')
+                zip_info = by_norm.get(normalized_rel) or by_base.get(os.path.basename(normalized_rel))
+                
+                if zip_info:
+                    try:
+                        timestamps[xml_path] = _format_zip_date(zip_info.date_time)
+                        continue
+                    except (ValueError, TypeError):
+                        pass
                 
-                # Create a mapping of relative paths to full paths
-                # We need to match zip entries to extracted XML files
-                for xml_path in xml_files:
-                    # Get relative path from extract folder
-                    rel_path = os.path.relpath(xml_path, self.extract_folder)
-                    
-                    # Try to find matching entry in zip
-                    # Handle both forward and backward slashes
-                    zip_entry = None
-                    for entry_name in zip_ref.namelist():
-                        # Normalize paths for comparison
-                        normalized_entry = entry_name.replace('\\', '/')
-                        normalized_rel = rel_path.replace('\\', '/')
-                        
-                        if normalized_entry == normalized_rel or normalized_entry.endswith('/' + normalized_rel):
-                            zip_entry = entry_name
-                            break
-                        # Also check if the entry name matches the filename
-                        if os.path.basename(normalized_entry) == os.path.basename(normalized_rel):
-                            zip_entry = entry_name
-                            break
-                    
-                    if zip_entry:
-                        try:
-                            zip_info = zip_ref.getinfo(zip_entry)
-                            # zip_info.date_time is a tuple: (year, month, day, hour, minute, second)
-                            dt = datetime(*zip_info.date_time)
-                            timestamps[xml_path] = dt.strftime('%Y-%m-%d %H:%M:%S')
-                        except (KeyError, ValueError, TypeError):
-                            # If we can't get timestamp, use file system timestamp as fallback
-                            try:
-                                file_stat = os.stat(xml_path)
-                                dt = datetime.fromtimestamp(file_stat.st_mtime)
-                                timestamps[xml_path] = dt.strftime('%Y-%m-%d %H:%M:%S')
-                            except OSError:
-                                timestamps[xml_path] = 'Unknown'
-                    else:
-                        # If not found in zip, use file system timestamp
-                        try:
-                            file_stat = os.stat(xml_path)
-                            dt = datetime.fromtimestamp(file_stat.st_mtime)
-                            timestamps[xml_path] = dt.strftime('%Y-%m-%d %H:%M:%S')
-                        except OSError:
-                            timestamps[xml_path] = 'Unknown'
+                # If not found in zip (or its date is bad), use file system timestamp
+                timestamps[xml_path] = self._file_timestamp(xml_path)
         except Exception as e:
             print(f"Warning: Could not extract timestamps: {str(e)}")
         
         return timestamps
     
-    def read_xml_file(self, xml_filename: str) -> Tuple[bool, str, Optional[str], Optional[str]]:
+    def _file_timestamp(self, xml_path: str) -> str:
+        """
+        Get the file system modification time of an extracted XML file.
+        
+        Args:
+            xml_path: Path to the extracted XML file
+        
+        Returns:
+            Formatted timestamp, or 'Unknown' if the file cannot be stat'ed
+        """
+        try:
+            file_stat = os.stat(xml_path)
+            dt = datetime.fromtimestamp(file_stat.st_mtime)
+            return dt.strftime('%Y-%m-%d %H:%M:%S')
+        except OSError:
+            return 'Unknown'
+    
+    def read_xml_file(self, xml_filename: str, binary: bool = False) -> Tuple[bool, str, Optional[Union[str, bytes]], Optional[str]]:
         """
         Read and return the contents of a specific XML file.
         
         Args:
             xml_filename: Name of the XML file to read (can be just filename or relative path)
+            binary: If True, return the raw bytes (e.g. for lxml.etree.fromstring) instead of text
+        
+        Returns:
+            Tuple of (success, message, content, actual_filename)
+        """
+        key = (xml_filename, binary)
+        with self._lock:
+            cached = self._content_cache.get(key)
+            if cached is not None:
+                self._content_cache.move_to_end(key)
+                return cached
+        
+        # Read outside the lock so concurrent reads of different members overlap
+        result = self._read_xml_file(xml_filename, binary)
+        if result[0]:
+            with self._lock:
+                self._content_cache[key] = result
+                if len(self._content_cache) > CONTENT_CACHE_SIZE:
+                    self._content_cache.popitem(last=False)
+        return result
+    
+    async def read_xml_file_async(self, xml_filename: str, binary: bool = False) -> Tuple[bool, str, Optional[Union[str, bytes]], Optional[str]]:
+        """
+        Async variant of read_xml_file that runs the read in a worker thread.
+        
+        Args:
+            xml_filename: Name of the XML file to read (can be just filename or relative path)
+            binary: If True, return the raw bytes instead of text
+        
+        Returns:
+            Tuple of (success, message, content, actual_filename)
+        """
+        return await _run_in_thread(self.read_xml_file, xml_filename, binary)
+    
+    def _read_xml_file(self, xml_filename: str, binary: bool) -> Tuple[bool, str, Optional[Union[str, bytes]], Optional[str]]:
+        """
+        Read an XML file from the archive or the extracted folder, bypassing the content cache.
+        
+        Args:
+            xml_filename: Name of the XML file to read (can be just filename or relative path)
+            binary: If True, return the raw bytes instead of decoded text
         
         Returns:
             Tuple of (success, message, content, actual_filename)
         """
-        if not self.extract_folder:
-            return False, "No extraction folder. Please extract zip file first.", None, None
+        if self.extract_folder is None:
+            return self._read_xml_member(xml_filename, binary)
         
         # Try to find the file
+        if self._path_index:
+            # Extracted by extract_zip: one lookup in the index built from the namelist
+            target_path = self._path_index.get(xml_filename) or self._path_index.get(os.path.basename(xml_filename))
+        else:
+            target_path = self._find_extracted_file(xml_filename)
+        
+        if not target_path:
+            return False, f"File '{xml_filename}' not found in extracted folder.", None, None
+        
+        try:
+            content = _read_file_mmap(target_path, None if binary else 'utf-8')
+            actual_filename = os.path.basename(target_path)
+            return True, f"Successfully read '{xml_filename}'", content, actual_filename
+        except Exception as e:
+            return False, f"Error reading file: {str(e)}", None, None
+    
+    def _find_extracted_file(self, xml_filename: str) -> Optional[str]:
+        """
+        Search a pre-extracted folder (no namelist available) for a file.
+        
+        Args:
+            xml_filename: Name of the XML file to find (can be just filename or relative path)
+        
+        Returns:
+            Path of the first matching file, or None if not found
+        """
         target_path = None
         
         # First, try direct path
@@ -179,28 +657,137 @@ class XMLValidator:
         if os.path.exists(direct_path):
             target_path = direct_path
         else:
-            # Search in extracted files
-            for root, dirs, files in os.walk(self.extract_folder):
-                for file in files:
-                    if file == xml_filename or file.endswith(xml_filename):
-                        target_path = os.path.join(root, file)
-                        break
-                if target_path:
+            # Search in extracted files, stopping at the first basename match
+            basename = os.path.basename(xml_filename)
+            for entry in _iter_files(self.extract_folder):
+                if entry.name == basename:
+                    target_path = entry.path
                     break
         
-        if not target_path or not os.path.exists(target_path):
-            return False, f"File '{xml_filename}' not found in extracted folder.", None, None
+        return target_path
+    
+    def _resolve_member(self, zf: zipfile.ZipFile, name: str) -> Optional[str]:
+        """
+        Resolve a member name or basename to the archive member name.
+        
+        Args:
+            zf: Open ZipFile for this validator's archive
+            name: Member name (relative path) or just the filename
+        
+        Returns:
+            Matching member name, or None if there is no match
+        """
+        with self._lock:
+            if self._name_index is None:
+                # Index members by full name and by every trailing path suffix (first member wins).
+                # Built locally and published once complete, so no reader sees a partial index
+                name_index = {}
+                names = zf.namelist()
+                for member in names:
+                    for suffix in _path_suffixes(member):
+                        name_index.setdefault(suffix, member)
+                name_index.update({member: member for member in names})
+                self._name_index = name_index
+            name_index = self._name_index
+        
+        return name_index.get(name) or name_index.get(os.path.basename(name))
+    
+    def read_member_from_zip(self, name: str) -> bytes:
+        """
+        Read one member straight from the archive, without extracting anything to disk.
+        
+        Args:
+            name: Member name (relative path) or just the filename
+        
+        Returns:
+            Raw bytes of the member
+        
+        Raises:
+            KeyError: If no member matches the name
+            OSError: If the zip file cannot be read
+            zipfile.BadZipFile: If the zip file is invalid
+        """
+        zf = self._load_zip()
+        member = self._resolve_member(zf, name)
+        if member is None:
+            raise KeyError(f"File '{name}' not found in zip archive.")
+        return zf.read(member)
+    
+    def iter_xml_members(self) -> Iterator[Tuple[str, bytes]]:
+        """
+        Iterate over the XML members of the archive, reading each one into memory.
+        Nothing is extracted to disk, so there is no temp directory to clean up.
+        
+        Yields:
+            Tuple of (member_name, raw_bytes) for each XML member, in archive order
+        
+        Raises:
+            OSError: If the zip file cannot be read
+            zipfile.BadZipFile: If the zip file is invalid
+        """
+        zf = self._load_zip()
+        for info in zf.infolist():
+            if info.filename[-4:].lower() == '.xml':
+                yield info.filename, zf.read(info)
+    
+    def get_xml_content(self, name: str) -> str:
+        """
+        Read one XML member from the archive into memory and decode it.
+        
+        Unlike read_xml_file this always reads from the archive, even after
+        extract_zip, so a single target never needs to touch the disk.
+        
+        Args:
+            name: Member name (relative path) or just the filename
+        
+        Returns:
+            Decoded contents of the member
+        
+        Raises:
+            KeyError: If no member matches the name
+            UnicodeDecodeError: If the member is not valid UTF-8
+        """
+        return self.read_member_from_zip(name).decode('utf-8')
+    
+    def _read_xml_member(self, xml_filename: str, binary: bool = False) -> Tuple[bool, str, Optional[Union[str, bytes]], Optional[str]]:
+        """
+        Read an XML file straight from the archive without extracting it.
+        
+        Args:
+            xml_filename: Name of the XML file to read (can be just filename or relative path)
+            binary: If True, return the raw bytes instead of decoded text
+        
+        Returns:
+            Tuple of (success, message, content, actual_filename)
+        """
+        zf, error = self._open_zip()
+        if zf is None:
+            return False, error, None, None
+        
+        member = self._resolve_member(zf, xml_filename)
+        
+        if not member:
+            return False, f"File '{xml_filename}' not found in zip archive.", None, None
         
         try:
-            with open(target_path, 'r', encoding='utf-8') as file:
-                content = file.read()
-            actual_filename = os.path.basename(target_path)
+            content = self.read_member_from_zip(member) if binary else self.get_xml_content(member)
+            actual_filename = os.path.basename(member)
             return True, f"Successfully read '{xml_filename}'", content, actual_filename
         except Exception as e:
             return False, f"Error reading file: {str(e)}", None, None
     
     def cleanup(self):
-        """Clean up extracted files if using temp directory."""
+        """Release the archive and clean up extracted files if using temp directory."""
+        if self._zf is not None:
+            self._zf.close()
+            self._zf_file.close()
+        self._zf = None
+        self._zf_file = None
+        self._xml_files = None
+        self._name_index = None
+        self._path_index = {}
+        self._content_cache.clear()
+        
         if self.extract_folder and self.extract_to is None:
             try:
                 if os.path.exists(self.extract_folder):
@@ -208,12 +795,14 @@ class XMLValidator:
             except Exception as e:
                 print(f"Warning: Could not cleanup temp directory: {str(e)}")
     
-    def process_zip(self, target_xml: Optional[str] = None) -> Dict:
+    def process_zip(self, target_xml: Optional[str] = None, binary: bool = False) -> Dict:
         """
-        Complete workflow: validate, extract, and optionally read a specific XML file.
+        Complete workflow: validate, open, and optionally read a specific XML file.
+        Members are read in place from the archive; nothing is extracted to disk.
         
         Args:
-            target_xml: Optional XML filename to read after extraction
+            target_xml: Optional XML filename to read from the archive
+            binary: If True, xml_content holds the raw bytes instead of decoded text
         
         Returns:
             Dictionary with results
@@ -228,8 +817,8 @@ class XMLValidator:
             'xml_filename': target_xml
         }
         
-        # Extract zip
-        success, message, files = self.extract_zip()
+        # Open zip and list its members
+        success, message, files = self.open_zip()
         result['extracted_files'] = files
         result['message'] = message
         
@@ -241,11 +830,11 @@ class XMLValidator:
         result['xml_files'] = self.find_xml_files()
         
         # Get timestamps for XML files
-        result['xml_timestamps'] = self.get_xml_file_timestamps()
+        result['xml_timestamps'] = self.get_xml_file_timestamps(result['xml_files'])
         
         # Read target XML if specified, otherwise read first XML file
         if target_xml:
-            success, msg, content, actual_filename = self.read_xml_file(target_xml)
+            success, msg, content, actual_filename = self.read_xml_file(target_xml, binary)
             result['xml_content'] = content
             result['xml_filename'] = actual_filename if actual_filename else target_xml
             if not success:
@@ -257,7 +846,7 @@ class XMLValidator:
             if result['xml_files']:
                 first_xml_path = result['xml_files'][0]
                 first_xml_filename = os.path.basename(first_xml_path)
-                success, msg, content, actual_filename = self.read_xml_file(first_xml_filename)
+                success, msg, content, actual_filename = self.read_xml_file(first_xml_path, binary)
                 result['xml_content'] = content
                 result['xml_filename'] = actual_filename if actual_filename else first_xml_filename
                 if not success:
@@ -268,6 +857,77 @@ class XMLValidator:
                 result['success'] = True
         
         return result
+    
+    def process_zip_fast(self, target_xml: Optional[str] = None, binary: bool = False) -> Dict:
+        """
+        Same as process_zip, specialized for the common archive holding exactly one XML file.
+        That member is read directly, without building the name index; any other shape
+        (or a target_xml naming something else) falls through to process_zip. A validator
+        that has already run extract_zip always goes through process_zip, which reports
+        extracted paths.
+        
+        Args:
+            target_xml: Optional XML filename to read from the archive
+            binary: If True, xml_content holds the raw bytes instead of decoded text
+        
+        Returns:
+            Dictionary with results, as returned by process_zip
+        """
+        if self.extract_folder is not None:
+            return self.process_zip(target_xml, binary)
+        
+        # Same listing and cache reset as process_zip
+        success, message, files = self.open_zip()
+        if not success:
+            return self.process_zip(target_xml, binary)
+        
+        zf = self._load_zip()
+        infos = zf.infolist()
+        xml_infos = [info for info in infos if info.filename[-4:].lower() == '.xml']
+        if len(xml_infos) != 1:
+            return self.process_zip(target_xml, binary)
+        
+        info = xml_infos[0]
+        filename = os.path.basename(info.filename)
+        if target_xml and os.path.basename(target_xml) != filename:
+            return self.process_zip(target_xml, binary)
+        
+        try:
+            content = zf.read(info)
+            if not binary:
+                content = content.decode('utf-8')
+        except Exception:
+            # Let the general path report the error in its usual form
+            return self.process_zip(target_xml, binary)
+        
+        try:
+            timestamp = _format_zip_date(info.date_time)
+        except (ValueError, TypeError):
+            timestamp = 'Unknown'
+        
+        self._xml_files = [info.filename]
+        return {
+            'success': True,
+            'message': message,
+            'extracted_files': files,
+            'xml_files': self._xml_files,
+            'xml_timestamps': {info.filename: timestamp},
+            'xml_content': content,
+            'xml_filename': filename
+        }
+    
+    async def process_zip_async(self, target_xml: Optional[str] = None, binary: bool = False) -> Dict:
+        """
+        Async variant of process_zip that runs the whole workflow in a worker thread.
+        
+        Args:
+            target_xml: Optional XML filename to read from the archive
+            binary: If True, xml_content holds the raw bytes instead of decoded text
+        
+        Returns:
+            Dictionary with results
+        """
+        return await _run_in_thread(self.process_zip, target_xml, binary)
 
 
 def validate_zip_file(zip_path: str, target_xml: Optional[str] = None) -> Dict:
@@ -281,8 +941,6 @@ def validate_zip_file(zip_path: str, target_xml: Optional[str] = None) -> Dict:
     Returns:
         Dictionary with results
     """
-    validator = XMLValidator(zip_path)
-    try:
-        return validator.process_zip(target_xml)
-    finally:
-        validator.cleanup()
+    # The validator is never extracted here, so target_xml is read straight from the archive
+    with XMLValidator(zip_path) as validator:
+        return validator.process_zip_fast(target_xml)